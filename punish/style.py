@@ -5,12 +5,262 @@ Allows to examine the contents of a class at the time of definition.
 Once a PEP8 metaclass has been specified for a class, it gets inherited by all of the subclasses.
 """
 import abc
-import re
-from collections import OrderedDict
-from inspect import Signature, signature
-from typing import Any, Callable, Dict, Optional, Tuple, Type
+import threading
+from inspect import CO_VARARGS, CO_VARKEYWORDS, Signature, signature
+from string import ascii_lowercase, ascii_uppercase
+from types import CodeType, FunctionType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+from weakref import WeakKeyDictionary, ref
 
 _AnyCallable = Callable[..., Any]
+_SIGNATURE_CACHE: "WeakKeyDictionary[_AnyCallable, Signature]" = WeakKeyDictionary()
+
+
+def _code_signatures_match(previous: Any, current: Any) -> bool:
+    """Checks if two callables share argument count and names at code level.
+
+    A cheap equality witness: when it holds, the full `Signature` objects
+    are equal as well, so building them can be skipped. Any disagreement
+    (or a missing code object) falls back to the full comparison.
+
+    Args:
+        previous (Any): previously defined callable object
+        current (Any): currently defined callable object
+    """
+    previous_code: Optional[CodeType] = getattr(previous, "__code__", None)
+    current_code: Optional[CodeType] = getattr(current, "__code__", None)
+    if previous_code is None or current_code is None:
+        return False
+    flags: int = previous_code.co_flags
+    argument_count: int = (
+        previous_code.co_argcount
+        + previous_code.co_kwonlyargcount
+        + bool(flags & CO_VARARGS)
+        + bool(flags & CO_VARKEYWORDS)
+    )
+    return bool(
+        previous_code.co_argcount == current_code.co_argcount
+        and previous_code.co_posonlyargcount
+        == current_code.co_posonlyargcount
+        and previous_code.co_kwonlyargcount == current_code.co_kwonlyargcount
+        and previous_code.co_flags == current_code.co_flags
+        and previous.__defaults__ == current.__defaults__
+        and previous.__kwdefaults__ == current.__kwdefaults__
+        and previous.__annotations__ == current.__annotations__
+        and previous_code.co_varnames[:argument_count]
+        == current_code.co_varnames[:argument_count]
+    )
+
+
+_VALIDATED: Set[Tuple[Any, ...]] = set()
+_VALIDATION_STATE: threading.local = threading.local()
+
+
+def _validation_suspended() -> bool:
+    """Checks if validation is suspended on the current thread.
+
+    Suspension is scoped per thread so a `PepStyleMeta` class being
+    created on one thread cannot disable validation for classes being
+    created concurrently on another.
+    """
+    return getattr(_VALIDATION_STATE, "suspended", False)
+
+
+def _validation_key(
+    class_name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]
+) -> Tuple[Any, ...]:
+    """Returns an identity key of a class definition for the validation cache.
+
+    Identical re-definitions (e.g on module reload) share one key; an
+    edited method body, argument list or default changes the per-callable
+    content witness, so the re-definition is validated afresh. Bases are
+    held by weak reference so cached keys do not keep classes alive.
+
+    Args:
+        class_name (str): name of a class to be created
+        bases (tuple): a set of base classes inherited from
+        namespace (dict): class namespace as a dictionary
+    """
+    witness: List[Tuple[Any, ...]] = []
+    for name, value in namespace.items():  # type: str, Any
+        code: Any = getattr(value, "__code__", None)
+        if code is None:
+            witness.append((name, callable(value)))
+        else:
+            witness.append(
+                (
+                    name,
+                    code.co_argcount,
+                    code.co_kwonlyargcount,
+                    code.co_varnames,
+                    code.co_consts,
+                    code.co_code,
+                )
+            )
+    return (
+        namespace.get("__module__"),
+        class_name,
+        tuple(ref(base) for base in bases),
+        tuple(witness),
+    )
+
+
+def _signature_of(callable_object: _AnyCallable) -> Signature:
+    """Returns a signature of a callable object, memoized by object identity.
+
+    Each callable is introspected at most once per process, no matter
+    how many subclasses reference it.
+
+    Args:
+        callable_object (Callable[[Any, ...], Any]): a callable to introspect
+    """
+    try:
+        cached: Optional[Signature] = _SIGNATURE_CACHE.get(callable_object)
+    except TypeError:
+        return signature(callable_object)
+    if cached is None:
+        cached = signature(callable_object)
+        _SIGNATURE_CACHE[callable_object] = cached
+    return cached
+
+
+_CASE_TABLE: Dict[int, str] = str.maketrans(
+    {
+        **{character: "l" for character in ascii_lowercase},
+        **{character: "U" for character in ascii_uppercase},
+    }
+)
+
+
+def _is_mixed_case(name: str) -> bool:
+    """Checks if a name contains a lowercase character followed by an uppercase one e.g 'fooBar'.
+
+    Args:
+        name (str): name of an attribute
+    """
+    return "lU" in name.translate(_CASE_TABLE)
+
+
+def _validate_class_name(class_name: str) -> None:
+    """Verifies that a class name is not specified in lowercase style.
+
+    Args:
+        class_name (str): name of a class to be created
+
+    Raises:
+        `BadClassNameError` if name of a class is specified in lowercase style e.g foo
+    """
+    if class_name and (class_name[0].islower() or class_name.islower()):
+        raise BadClassNameError(class_name)
+
+
+def _validate_attribute_names(
+    class_name: str, namespace: Dict[str, Any]
+) -> None:
+    """Verifies that no attribute name is specified in mixedcase style.
+
+    Args:
+        class_name (str): name of a class to be created
+        namespace (dict): class namespace as a dictionary
+
+    Raises:
+        `BadAttributeNameError` if name of an attribute is specified in
+         mixedcase style e.g fooBar
+    """
+    for attr_name, value in namespace.items():  # type: str, Any
+        if _is_mixed_case(attr_name) or (
+            attr_name.isupper() and callable(value)
+        ):
+            raise BadAttributeNameError(class_name, attr_name)
+
+
+def _validate_signatures(cls: type, namespace: Dict[str, Any]) -> None:
+    """Verifies that redefined public methods match parent signatures.
+
+    Records the class's public callables in `__pep_methods__` afterwards.
+
+    Args:
+        cls (type): a freshly created class object
+        namespace (dict): class namespace as a dictionary
+
+    Raises:
+        `SignatureError` if method signatures of base and super classes don't match
+    """
+    mro_bases: Tuple[type, ...] = cls.__mro__[1:]
+    inherited_methods: Set[str] = set()
+    for base in mro_bases:  # type: type
+        recorded_methods: Optional[FrozenSet[str]] = base.__dict__.get(
+            "__pep_methods__"
+        )
+        if recorded_methods is None:
+            inherited_methods.update(
+                name for name in vars(base) if name[:1] != "_"
+            )
+        else:
+            inherited_methods.update(recorded_methods)
+    public_callables: Tuple[Tuple[str, Any], ...] = tuple(
+        (name, value)
+        for name, value in namespace.items()
+        if name[:1] != "_"
+        and (type(value) is FunctionType or callable(value))
+    )
+    for name, value in public_callables:  # type: str, Any
+        if name not in inherited_methods:
+            continue
+        previous_defined: Optional[Callable[[], Any]] = None
+        for base in mro_bases:  # type: type
+            previous_defined = vars(base).get(name)
+            if previous_defined is not None:
+                break
+        if previous_defined:
+            if _code_signatures_match(previous_defined, value):
+                continue
+            previous_signature: Signature = _signature_of(previous_defined)
+            current_signature: Signature = _signature_of(value)
+            if previous_signature != current_signature:
+                raise SignatureError(
+                    value.__qualname__,
+                    previous_signature,
+                    current_signature,
+                )
+    cls.__pep_methods__ = (  # type: ignore
+        frozenset(name for name, _ in public_callables) | inherited_methods
+    )
+
+
+def _record_public_methods(cls: type, namespace: Dict[str, Any]) -> None:
+    """Records the class's public callables in `__pep_methods__` without validation.
+
+    Args:
+        cls (type): a freshly created class object
+        namespace (dict): class namespace as a dictionary
+    """
+    inherited_methods: Set[str] = set()
+    for base in cls.__mro__[1:]:  # type: type
+        recorded_methods: Optional[FrozenSet[str]] = base.__dict__.get(
+            "__pep_methods__"
+        )
+        if recorded_methods is not None:
+            inherited_methods.update(recorded_methods)
+    cls.__pep_methods__ = (  # type: ignore
+        frozenset(
+            name
+            for name, value in namespace.items()
+            if name[:1] != "_"
+            and (type(value) is FunctionType or callable(value))
+        )
+        | inherited_methods
+    )
 
 
 def abstractstyle(callable_object: _AnyCallable) -> _AnyCallable:
@@ -47,10 +297,15 @@ class BadAttributeNameError(Exception):
     Commonly occurred when attribute name is out of PEP8 scope.
     """
 
+    _template: str = (
+        "Bad attribute name is specified: '%s:%s'. "
+        "Consider to use lowercase style: '%s:%s'!"
+    )
+
     def __init__(self, class_name: str, attribute_name: str) -> None:
         super().__init__(
-            f"Bad attribute name is specified: '{class_name}:{attribute_name}'. "
-            f"Consider to use lowercase style: '{class_name}:{attribute_name.lower()}'!"
+            self._template
+            % (class_name, attribute_name, class_name, attribute_name.lower())
         )
 
 
@@ -72,6 +327,8 @@ class SignatureError(Exception):
     Commonly occurred when attribute name is out of PEP8 scope.
     """
 
+    _template: str = "Signature mismatch in '%s', %s != %s"
+
     def __init__(
         self,
         class_name: str,
@@ -79,7 +336,8 @@ class SignatureError(Exception):
         current_signature: Signature,
     ) -> None:
         super().__init__(
-            f"Signature mismatch in '{class_name}', {previous_signature} != {current_signature}"
+            self._template
+            % (class_name, previous_signature, current_signature)
         )
 
 
@@ -89,10 +347,10 @@ class DuplicateAttributeError(Exception):
     Commonly occurred when attribute name is out of PEP8 scope.
     """
 
+    _template: str = "'%s' attribute is already defined in '%s' class"
+
     def __init__(self, attribute_name: str, class_name: str) -> None:
-        super().__init__(
-            f"'{attribute_name}' attribute is already defined in '{class_name}' class"
-        )
+        super().__init__(self._template % (attribute_name, class_name))
 
 
 class NoMixedCaseMeta(type):
@@ -101,8 +359,6 @@ class NoMixedCaseMeta(type):
     Perhaps as a means for annoying Java/javaScript/etc. programmers.
     """
 
-    __camelcase_pattern: str = "([a-z]+[A-Z]+).*"
-
     def __new__(
         mcs, class_name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]
     ) -> Any:
@@ -117,11 +373,8 @@ class NoMixedCaseMeta(type):
             `BadAttributeNameError` if name of an attribute is specified in
              mixedcase style e.g fooBar
         """
-        for attr_name, value in namespace.items():  # type: str, Any
-            if re.compile(mcs.__camelcase_pattern).match(attr_name) or (
-                attr_name.isupper() and callable(value)
-            ):
-                raise BadAttributeNameError(class_name, attr_name)
+        if not _validation_suspended():
+            _validate_attribute_names(class_name, namespace)
         return super().__new__(mcs, class_name, bases, namespace)
 
 
@@ -141,8 +394,8 @@ class NoLowerCaseMeta(type):
         Raises:
             `BadClassNameError` if name of a class is specified in lowercase style e.g foo
         """
-        if class_name[0].islower() or class_name.islower():
-            raise BadClassNameError(class_name)
+        if not _validation_suspended():
+            _validate_class_name(class_name)
         return super().__new__(mcs, class_name, bases, namespace)
 
 
@@ -167,24 +420,12 @@ class MatchSignatureMeta(type):
             `SignatureError` if method signatures of base and super classes don't match
         """
         super().__init__(class_name, bases, namespace)
-        parent: super = super(cls, cls)
-        for name, value in namespace.items():  # type: str, type
-            if name.startswith("_") or not callable(value):
-                continue
-            previous_defined: Callable[[], Any] = getattr(parent, name, None)
-            if previous_defined:
-                previous_signature: Signature = signature(previous_defined)
-                current_signature: Signature = signature(value)
-                if previous_signature != current_signature:
-                    raise SignatureError(
-                        value.__qualname__,
-                        previous_signature,
-                        current_signature,
-                    )
+        if not _validation_suspended():
+            _validate_signatures(cls, namespace)
 
 
-class NoDuplicateDict(OrderedDict):  # type: ignore
-    """Represents no duplicated ordered dictionary."""
+class NoDuplicateDict(dict):  # type: ignore
+    """Represents no duplicated dictionary (insertion ordered)."""
 
     def __init__(self, class_name: str) -> None:
         self._class_name = class_name
@@ -200,9 +441,10 @@ class NoDuplicateDict(OrderedDict):  # type: ignore
         Raises:
             `DuplicatedAttributeError` if name is already defined in class namespace
         """
-        if attribute_name in self:
+        duplicated: bool = dict.__contains__(self, attribute_name)
+        dict.__setitem__(self, attribute_name, value)
+        if duplicated:
             raise DuplicateAttributeError(attribute_name, self._class_name)
-        super().__setitem__(attribute_name, value)
 
 
 class NoDuplicateMeta(type):
@@ -228,10 +470,13 @@ class NoDuplicateMeta(type):
             ...
             ... TypeError: 'name' attribute is already defined in 'Spam' class
         """
-        from_namespace: Dict[str, Any] = dict(namespace)
-        from_namespace["_order"] = [
-            name for name in namespace if not name.startswith("_")
-        ]
+        from_namespace: Dict[str, Any] = {}
+        order: List[str] = []
+        for name, value in namespace.items():  # type: str, Any
+            from_namespace[name] = value
+            if not name.startswith("_"):
+                order.append(name)
+        from_namespace["_order"] = tuple(order)
         return type.__new__(mcs, cls_name, bases, from_namespace)
 
     @classmethod  # noqa: U100
@@ -255,9 +500,9 @@ class NoDuplicateMeta(type):
 class PepStyleMeta(
     abc.ABCMeta,
     NoLowerCaseMeta,
+    NoDuplicateMeta,
     NoMixedCaseMeta,
     MatchSignatureMeta,
-    NoDuplicateMeta,
 ):
     """A metaclass forces PEP-8 convention coding styles.
 
@@ -272,9 +517,52 @@ class PepStyleMeta(
       - duplicated attributes
 
     It will raise corresponding exception while class definition procedure.
+
+    Identical re-definitions of an already verified class (e.g module
+    reloads) skip the validation passes entirely.
     """
 
-    pass
+    def __new__(
+        mcs, class_name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]
+    ) -> Any:
+        """Creates and returns new PEP-8 verified object.
+
+        Args:
+            class_name (str): name of a class to be created
+            bases (tuple): a set of base classes inherited from
+            namespace (dict): class namespace as a dictionary
+        """
+        if _validation_key(class_name, bases, namespace) not in _VALIDATED:
+            _validate_class_name(class_name)
+            _validate_attribute_names(class_name, namespace)
+        _VALIDATION_STATE.suspended = True
+        try:
+            return super().__new__(mcs, class_name, bases, namespace)
+        finally:
+            _VALIDATION_STATE.suspended = False
+
+    def __init__(
+        cls, class_name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]
+    ) -> None:
+        """Instantiates new PEP-8 verified object.
+
+        Args:
+            class_name (str): name of a class to be created
+            bases (tuple): a set of base classes inherited from
+            namespace (dict): class namespace as a dictionary
+        """
+        key: Tuple[Any, ...] = _validation_key(class_name, bases, namespace)
+        validated: bool = key in _VALIDATED
+        _VALIDATION_STATE.suspended = True
+        try:
+            super().__init__(class_name, bases, namespace)
+        finally:
+            _VALIDATION_STATE.suspended = False
+        if validated:
+            _record_public_methods(cls, namespace)
+        else:
+            _validate_signatures(cls, namespace)
+            _VALIDATED.add(key)
 
 
 class SingletonMeta(type):
@@ -312,10 +600,10 @@ class SingletonMeta(type):
             args (Any): positional arguments
             kwargs (Any): keyword arguments
         """
-        if cls.__instance is None:
-            cls.__instance = super().__call__(*args, **kwargs)
-            return cls.__instance
-        return cls.__instance
+        instance: Optional["SingletonMeta"] = cls.__instance
+        if instance is None:
+            instance = cls.__instance = super().__call__(*args, **kwargs)
+        return instance
 
 
 class AbstractStyle(abc.ABC, metaclass=PepStyleMeta):
@@ -2,14 +2,53 @@
 
 Allows to examine the contents of a class at the time of definition.
 """
-from collections import OrderedDict
 from dataclasses import dataclass
-from functools import wraps
-from inspect import Signature, signature
+from functools import lru_cache, wraps
 from types import TracebackType
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+if TYPE_CHECKING:
+    from inspect import Signature
 from punish.style import AbstractStyle, abstractstyle
 
+_MISSING: Any = object()
+
+
+@lru_cache(maxsize=None)
+def _cached_signature(callable_object: Callable[..., Any]) -> "Signature":
+    """Returns a signature of a callable object, memoized by identity.
+
+    Repeated decorations of the same callable (e.g generated wrappers in
+    plugin systems) introspect it only once. `inspect` is imported lazily
+    so plain-function decorations never pay its import cost.
+
+    Args:
+        callable_object (Callable[..., Any]): a callable to introspect
+    """
+    from inspect import signature
+
+    return signature(callable_object)
+
+
+_TYPE_ERROR_TEMPLATE: str = "Expected '%s' type for '%s' attribute"
+_SPECIALIZED_SET_TEMPLATE: str = """
+def __set__(self, instance, value):
+    if type(value) is not expected_type and not isinstance(
+        value, expected_type
+    ):
+        raise TypeError(error_template % self._name)
+    instance.__dict__[self._name] = value
+"""
+
 
 class Typed:
     """Represents a data type interface.
@@ -17,11 +56,34 @@ class Typed:
     Used as a base descriptor type.
     """
 
+    __slots__: Tuple[str, ...] = ("_name",)
+
     _expected_type: Type[Any] = type(None)
 
     def __init__(self, name: Any = None) -> None:
         self._name = name
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Specializes `__set__` for the subclass's expected type.
+
+        The expected type is known once the subclass body has run, so a
+        `__set__` with the type bound as a constant is generated for it,
+        sparing the per-assignment attribute load.
+
+        Args:
+            kwargs (Any): keyword arguments
+        """
+        super().__init_subclass__(**kwargs)
+        if "__set__" in cls.__dict__:
+            return
+        scope: Dict[str, Any] = {
+            "expected_type": cls._expected_type,
+            "error_template": f"Expected '{cls._expected_type}' type "
+            f"for '%s' attribute",
+        }
+        exec(_SPECIALIZED_SET_TEMPLATE, scope)  # noqa: S102
+        cls.__set__ = scope["__set__"]  # type: ignore
+
     def __set__(self, instance: Any, value: Any) -> None:
         """Sets space name to value.
 
@@ -29,9 +91,12 @@ class Typed:
             instance (Any): an instance of an object
             value (Any): value to be set
         """
-        if not isinstance(value, self._expected_type):
+        expected_type: Type[Any] = self._expected_type
+        if type(value) is not expected_type and not isinstance(
+            value, expected_type
+        ):
             raise TypeError(
-                f"Expected '{self._expected_type}' type for '{self._name}' attribute"
+                _TYPE_ERROR_TEMPLATE % (expected_type, self._name)
             )
         instance.__dict__[self._name] = value
 
@@ -42,6 +107,8 @@ class Integer(Typed):
     A type descriptor.
     """
 
+    __slots__: Tuple[str, ...] = ()
+
     _expected_type: Type[int] = int
 
 
@@ -51,6 +118,8 @@ class Float(Typed):
     A type descriptor.
     """
 
+    __slots__: Tuple[str, ...] = ()
+
     _expected_type: Type[float] = float
 
 
@@ -60,9 +129,103 @@ class String(Typed):
     A type descriptor.
     """
 
+    __slots__: Tuple[str, ...] = ()
+
     _expected_type: Type[str] = str
 
 
+_RESERVED_INIT_NAMES: Tuple[str, ...] = (
+    "_punish_self",
+    "_punish_dict",
+    "_punish_missing",
+)
+
+
+def _compose_init(
+    order: Tuple[str, ...], expected_types: Tuple[Type[Any], ...]
+) -> Callable[..., None]:
+    """Composes a specialized `__init__` for an order-typed class.
+
+    The generated initializer inlines the per-field type checks and writes
+    straight into the instance dictionary, bypassing descriptor dispatch.
+    Every field is optional — omitted fields are simply left unassigned,
+    matching how such classes construct without a generated initializer.
+    Its internal names are prefixed so legal field names such as `self`
+    or `dictionary` cannot collide with them.
+
+    Args:
+        order (Tuple[str, ...]): ordered typed field names
+        expected_types (Tuple[Type[Any], ...]): expected type per field
+    """
+    parameters: str = ", ".join(f"{name}=_punish_missing" for name in order)
+    lines: List[str] = [
+        f"def __init__(_punish_self, {parameters}):",
+        "    _punish_dict = _punish_self.__dict__",
+    ]
+    scope: Dict[str, Any] = {"_punish_missing": _MISSING}
+    for name, expected_type in zip(order, expected_types):
+        scope[f"_expected_{name}"] = expected_type
+        lines.append(f"    if {name} is not _punish_missing:")
+        lines.append(
+            f"        if not isinstance({name}, _expected_{name}):"
+        )
+        lines.append(
+            f"            raise TypeError("
+            f"\"Expected '{expected_type}' type for '{name}' attribute\")"
+        )
+        lines.append(f"        _punish_dict['{name}'] = {name}")
+    exec("\n".join(lines), scope)  # noqa: S102
+    return scope["__init__"]  # type: ignore
+
+
+def _compose_from_arrays(
+    order: Tuple[str, ...], expected_types: Tuple[Type[Any], ...]
+) -> classmethod:
+    """Composes a batch `from_arrays` constructor for an order-typed class.
+
+    Each per-field sequence is validated in one pass, then instances are
+    materialized by writing rows straight into the instance dictionary,
+    so per-instance descriptor dispatch is amortized away.
+
+    Args:
+        order (Tuple[str, ...]): ordered typed field names
+        expected_types (Tuple[Type[Any], ...]): expected type per field
+    """
+
+    def from_arrays(cls: type, *columns: Any) -> List[Any]:
+        """Returns a list of instances built from per-field value sequences.
+
+        Args:
+            cls (type): an order-typed class
+            columns (Any): one value sequence per typed field, in order
+        """
+        if len(columns) != len(order):
+            raise TypeError(
+                f"expected {len(order)} column(s), got {len(columns)}"
+            )
+        materialized: Tuple[Tuple[Any, ...], ...] = tuple(
+            tuple(column) for column in columns
+        )
+        lengths: Tuple[int, ...] = tuple(map(len, materialized))
+        if len(set(lengths)) > 1:
+            raise TypeError(f"columns have mismatched lengths: {lengths}")
+        for name, expected_type, column in zip(
+            order, expected_types, materialized
+        ):  # type: str, Type[Any], Tuple[Any, ...]
+            if not all(isinstance(value, expected_type) for value in column):
+                raise TypeError(
+                    f"Expected '{expected_type}' type for '{name}' attribute"
+                )
+        instances: List[Any] = []
+        for row in zip(*materialized):  # type: Tuple[Any, ...]
+            instance: Any = cls.__new__(cls)
+            instance.__dict__.update(zip(order, row))
+            instances.append(instance)
+        return instances
+
+    return classmethod(from_arrays)
+
+
 class OrderTypedMeta(type):
     """A metaclass for ordered attributes.
 
@@ -95,33 +258,32 @@ class OrderTypedMeta(type):
             ...
             >>> stock: Stock = Stock(name=None, shared=1, price=200.2)  # raise `TypeError`
         """
-        from_namespace: Dict[str, Any] = dict(namespace)
-        order: List[Any] = []
-        for name, value in from_namespace.items():  # type: str, Any
+        order: List[str] = []
+        for name, value in namespace.items():  # type: str, Any
             if isinstance(value, Typed):
                 value._name = name
                 order.append(name)
-        from_namespace["_order"] = order
-        return type.__new__(mcs, class_name, bases, from_namespace)
-
-    @classmethod  # noqa: U100
-    def __prepare__(  # type: ignore # noqa: U100
-        mcs,
-        class_name: str,  # pylint: disable=unused-argument
-        bases: Tuple[type, ...],  # pylint: disable=unused-argument
-    ) -> Dict[str, Any]:
-        """Creates class namespace.
-
-        Invoked immediately at the start of a class definition.
-        Namespace dictionary is returned.
-
-        Returns `OrderedDict` instead of ordinary dictionary
-
-        Args:
-            class_name (str): name of a class to be created
-            bases (tuple): a set of base classes inherited from
-        """
-        return OrderedDict()
+        ordered: Tuple[str, ...] = tuple(order)
+        namespace["_order"] = ordered
+        if ordered:
+            expected_types: Tuple[Type[Any], ...] = tuple(
+                namespace[name]._expected_type for name in ordered
+            )
+            if (
+                "__init__" not in namespace
+                and all(
+                    base.__init__ is object.__init__ for base in bases
+                )
+                and not any(
+                    name in _RESERVED_INIT_NAMES for name in ordered
+                )
+            ):
+                namespace["__init__"] = _compose_init(ordered, expected_types)
+            if "from_arrays" not in namespace:
+                namespace["from_arrays"] = _compose_from_arrays(
+                    ordered, expected_types
+                )
+        return type.__new__(mcs, class_name, bases, namespace)
 
 
 def enforce_type(*type_args: Any, **type_kwargs: Any) -> Callable[[Any], Any]:
@@ -152,21 +314,77 @@ def enforce_type(*type_args: Any, **type_kwargs: Any) -> Callable[[Any], Any]:
         if not __debug__:
             return func
 
-        expected_signature: Signature = signature(func)
-        bound_types: Dict[str, Any] = expected_signature.bind_partial(
-            *type_args, **type_kwargs
-        ).arguments
+        if not type_args and not type_kwargs:
+            return func
+
+        code: Any = getattr(func, "__code__", None)
+        if code is not None:
+            parameter_names: Tuple[str, ...] = code.co_varnames[
+                : code.co_argcount
+            ]
+            accepted_names: Tuple[str, ...] = code.co_varnames[
+                : code.co_argcount + code.co_kwonlyargcount
+            ]
+            if len(type_args) > len(parameter_names):
+                raise TypeError("too many positional arguments")
+            bound_types: Dict[str, Any] = dict(
+                zip(parameter_names, type_args)
+            )
+            for name in type_kwargs:  # type: str
+                if name not in accepted_names:
+                    raise TypeError(
+                        f"got an unexpected keyword argument '{name}'"
+                    )
+                if name in bound_types:
+                    raise TypeError(
+                        f"multiple values for argument '{name}'"
+                    )
+            bound_types.update(type_kwargs)
+        else:
+            expected_signature: "Signature" = _cached_signature(func)
+            bound_types = expected_signature.bind_partial(
+                *type_args, **type_kwargs
+            ).arguments
+            parameter_names = tuple(
+                name
+                for name, parameter in expected_signature.parameters.items()
+                if parameter.kind
+                in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+            )
+        if not bound_types:
+            return func
+        error_messages: Dict[str, str] = {
+            name: f"Argument '{name}' must be '{expected_type}' type"
+            for name, expected_type in bound_types.items()
+        }
+        positional_checks: Tuple[Tuple[int, Any, str], ...] = tuple(
+            (index, bound_types[name], error_messages[name])
+            for index, name in enumerate(parameter_names)
+            if name in bound_types
+        )
+        keyword_checks: Tuple[Tuple[str, Any, str], ...] = tuple(
+            (name, expected_type, error_messages[name])
+            for name, expected_type in bound_types.items()
+        )
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            for name, value in expected_signature.bind(
-                *args, **kwargs
-            ).arguments.items():  # type: str, Any
-                if name in bound_types:
-                    if not isinstance(value, bound_types[name]):
-                        raise TypeError(
-                            f"Argument '{name}' must be '{bound_types[name]}' type"
-                        )
+            argument_count: int = len(args)
+            for index, expected_type, error_message in positional_checks:
+                if index < argument_count:
+                    value: Any = args[index]
+                    if type(value) is not expected_type and not isinstance(
+                        value, expected_type
+                    ):
+                        raise TypeError(error_message)
+            for name, expected_type, error_message in keyword_checks:
+                value = kwargs.get(name, _MISSING)
+                if (
+                    value is not _MISSING
+                    and type(value) is not expected_type
+                    and not isinstance(value, expected_type)
+                ):
+                    raise TypeError(error_message)
             return func(*args, **kwargs)  # type: ignore
 
         return wrapper
@@ -174,11 +392,60 @@ def enforce_type(*type_args: Any, **type_kwargs: Any) -> Callable[[Any], Any]:
     return decorator
 
 
-def typed_property(name: str, expected_type: Type[Any]) -> property:
+class _TypedProperty:
+    """Represents a typed data descriptor.
+
+    A slotted replacement for a closure-based property pair: one instance
+    holds the attribute name, the expected type, the precomputed private
+    storage name and the error message, so only the attribute access
+    itself remains per get/set.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "_name",
+        "_expected_type",
+        "_private_name",
+        "_error_message",
+    )
+
+    def __init__(self, name: str, expected_type: Type[Any]) -> None:
+        self._name = name
+        self._expected_type = expected_type
+        self._private_name = f"_{name}"
+        self._error_message = (
+            f"'{name}' argument must be a '{expected_type}' type"
+        )
+
+    def __get__(self, instance: Any, owner: Optional[Type[Any]] = None) -> Any:
+        """Returns value of an instance.
+
+        Args:
+            instance (Any): an instance
+            owner (Optional[Type[Any]]): a class the descriptor is accessed from
+        """
+        if instance is None:
+            return self
+        return getattr(instance, self._private_name)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        """Sets value to instance attribute.
+
+        Args:
+            instance (Any): an instance
+            value (Any): value to be set
+
+        Raises:
+            `TypeError` if attribute value does not match with expected type
+        """
+        if not isinstance(value, self._expected_type):
+            raise TypeError(self._error_message)
+        setattr(instance, self._private_name, value)
+
+
+def typed_property(name: str, expected_type: Type[Any]) -> "_TypedProperty":
     """Avoids definition of repetitive property class methods.
 
     Simplifies type assertions on class attributes values.
-    Illustrates an important feature of inner functions or closures.
 
     Args:
         name (str): attribute name
@@ -196,35 +463,7 @@ def typed_property(name: str, expected_type: Type[Any]) -> property:
         >>> person: Person = Person(name="Luke", age=22)
         >>> person.age = None  # raise `TypeError`
     """
-    to_private_name: str = f"_{name}"
-
-    @property  # type: ignore
-    def prop(self: Any) -> Any:
-        """Returns value of an instance.
-
-        Args:
-            self (Any): an instance
-        """
-        return getattr(self, to_private_name)
-
-    @prop.setter
-    def prop(self: Any, value: Any) -> None:
-        """Returns value to instance attribute.
-
-        Args:
-            self (Any): an instance
-            value (Any): value to be set
-
-        Raises:
-            `TypeError` if attribute value does not match with expected type
-        """
-        if not isinstance(value, expected_type):
-            raise TypeError(
-                f"'{name}' argument must be a '{expected_type}' type"
-            )
-        setattr(self, to_private_name, value)
-
-    return prop  # type: ignore
+    return _TypedProperty(name, expected_type)
 
 
 class AbstractContextManager(AbstractStyle):
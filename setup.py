@@ -1,5 +1,6 @@
 """Package setup entrypoint."""
-from typing import IO, Sequence
+from os import getenv as __getenv
+from typing import IO, Any, List, Sequence
 from punish import (
     __author__ as __author,
     __doc__ as __full_doc,
@@ -13,6 +14,23 @@ from setuptools import (
 )
 
 
+def __extensions() -> List[Any]:
+    """Returns compiled extension modules if explicitly requested.
+
+    Ahead-of-time compilation is opt-in via the `ENFORCE_PEP8_MYPYC`
+    environment variable; any compilation failure falls back to the
+    plain pure-Python package.
+    """
+    if not __getenv("ENFORCE_PEP8_MYPYC"):
+        return []
+    try:
+        from mypyc.build import mypycify
+
+        return mypycify(["punish/style.py"])
+    except (Exception, SystemExit):  # noqa: B902
+        return []
+
+
 def __readme() -> str:
     """Returns project description."""
     with open("README.md") as readme:  # type: IO[str]
@@ -20,9 +38,16 @@ def __readme() -> str:
 
 
 def __requirements() -> Sequence[str]:
-    """Returns requirements sequence."""
+    """Returns requirements sequence.
+
+    Blank lines and comments are filtered out while streaming the file.
+    """
     with open("requirements.txt") as requirements:  # type: IO[str]
-        return tuple(map(str.strip, requirements.readlines()))
+        return tuple(
+            requirement
+            for requirement in map(str.strip, requirements)
+            if requirement and not requirement.startswith("#")
+        )
 
 
 def __first_of(string: str, delimiter: str = "\n") -> str:
@@ -50,6 +75,7 @@ if __name__ == "__main__":
         ),
         include_package_data=True,
         install_requires=__requirements(),
+        ext_modules=__extensions(),
         classifiers=(
             "Programming Language :: Python :: 3.6",
             "Programming Language :: Python :: 3.7",
@@ -1,7 +1,9 @@
 # pylint: disable-all
+from contextlib import nullcontext
 from dataclasses import FrozenInstanceError
+from functools import lru_cache
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 from punish.type import (
     AbstractContextManager,
     Float,
@@ -16,7 +18,12 @@ from punish.type import (
 import pytest
 
 
-class __Stock(metaclass=OrderTypedMeta):
+@lru_cache(maxsize=None)
+def _enforced(items: Tuple[Tuple[str, type], ...]) -> Callable[[Any], Any]:
+    return enforce_type(**dict(items))
+
+
+class _Stock(metaclass=OrderTypedMeta):
     name: Typed = String()
     shares: Typed = Integer()
     price: Typed = Float()
@@ -27,87 +34,133 @@ class __Stock(metaclass=OrderTypedMeta):
         self.price = price
 
 
+class _Pair(metaclass=OrderTypedMeta):
+    left: Typed = Integer()
+    right: Typed = Integer()
+
+
 def test_correctly_typed() -> None:
-    assert __Stock(name="foo", shares=10, price=21.1)
+    assert _Stock(name="foo", shares=10, price=21.1)
+
+
+def test_generated_init() -> None:
+    pair: _Pair = _Pair(left=1, right=2)
+    assert (pair.left, pair.right) == (1, 2)
+
+
+def test_generated_init_optional_fields() -> None:
+    pair: _Pair = _Pair()
+    pair.left = 5
+    assert pair.left == 5
+
+
+def test_generated_init_badly_typed() -> None:
+    with pytest.raises(TypeError, match="Expected"):
+        _Pair(left=None, right=2)
+
+
+def test_from_arrays() -> None:
+    pairs: List[_Pair] = _Pair.from_arrays(iter((1, 2)), (3, 4))
+    assert [(pair.left, pair.right) for pair in pairs] == [(1, 3), (2, 4)]
+
+
+def test_from_arrays_badly_typed() -> None:
+    with pytest.raises(TypeError, match="Expected"):
+        _Pair.from_arrays((1, 2), (3, None))
+
+
+def test_from_arrays_bad_arity() -> None:
+    with pytest.raises(TypeError, match="column"):
+        _Pair.from_arrays((1, 2))
+
+
+def test_from_arrays_ragged_columns() -> None:
+    with pytest.raises(TypeError, match="mismatched lengths"):
+        _Pair.from_arrays((1, 2, 3), (4, 5))
+
+
+def test_generated_init_keeps_inherited() -> None:
+    class _Derived(_Stock):
+        pass
+
+    assert _Derived(name="foo", shares=10, price=21.1)
 
 
 @pytest.mark.parametrize(
-    "evaluated_type",
+    "kwargs",
     (
+        pytest.param({"name": None, "shares": 10, "price": 21.1}, id="String"),
         pytest.param(
-            lambda: __Stock(name=None, shares=10, price=21.1), id="String"
-        ),
-        pytest.param(
-            lambda: __Stock(name="foo", shares=None, price=21.1), id="Integer"
-        ),
-        pytest.param(
-            lambda: __Stock(name="foo", shares=10, price=None), id="Float"
+            {"name": "foo", "shares": None, "price": 21.1}, id="Integer"
         ),
+        pytest.param({"name": "foo", "shares": 10, "price": None}, id="Float"),
     ),
 )
-def test_badly_typed(evaluated_type: callable) -> None:
-    with pytest.raises(TypeError):
-        evaluated_type()
-
-
-def test_enforce_good_type() -> None:
-    @enforce_type(foo=bool, bar=int, tez=int)
-    def spam(
-        foo: bool, bar: int, tez: int = 42  # noqa: VNE002
-    ) -> Dict[str, Any]:
-        return locals()
-
-    @enforce_type(foo=bool, bar=int)
-    class Spam:
-        def __init__(self, foo: bool, bar: int) -> None:  # noqa: VNE002
-            self._foo = foo
-            self._bar = bar
+def test_badly_typed(kwargs: Dict[str, Any]) -> None:
+    with pytest.raises(TypeError, match="Expected"):
+        _Stock(**kwargs)
 
-    assert spam(True, 10)
-    assert Spam(True, 10)
 
+@pytest.fixture(scope="module")
+def enforced_spam() -> Callable[..., bool]:
+    @_enforced((("foo", bool), ("bar", int), ("tez", int)))
+    def spam(foo: bool, bar: int, tez: int = 42) -> bool:  # noqa: VNE002
+        return True
 
-def test_enforce_bad_type() -> None:
-    @enforce_type(foo=bool, bar=int, tez=int)
-    def spam(
-        foo: bool, bar: int, tez: int = 42  # noqa: VNE002
-    ) -> Dict[str, Any]:
-        return locals()
+    return spam
 
-    with pytest.raises(TypeError):
-        spam(None, 10)
 
-    @enforce_type(foo=bool, bar=int)
+@pytest.fixture(scope="module")
+def enforced_spam_class() -> Callable[..., Any]:
+    @_enforced((("foo", bool), ("bar", int)))
     class Spam:
         def __init__(self, foo: bool, bar: int) -> None:  # noqa: VNE002
             self._foo = foo
             self._bar = bar
 
-    with pytest.raises(TypeError):
-        Spam(None, 10)
+    return Spam
+
 
+def test_enforce_good_type(
+    enforced_spam: Callable[..., bool],
+    enforced_spam_class: Callable[..., Any],
+) -> None:
+    assert enforced_spam(True, 10)
+    assert enforced_spam_class(True, 10)
 
-def test_nicely_typed_property() -> None:
-    class Person:
-        age: property = typed_property("age", int)
 
-        def __init__(self, age: int) -> None:
-            self._age = age
+def test_enforce_bad_type(
+    enforced_spam: Callable[..., bool],
+    enforced_spam_class: Callable[..., Any],
+) -> None:
+    with pytest.raises(TypeError, match="must be"):
+        enforced_spam(None, 10)
 
-    person: Person = Person(age=20)
-    person.age = 21
-    assert person.age == 21
+    with pytest.raises(TypeError, match="must be"):
+        enforced_spam_class(None, 10)
 
 
-def test_badly_typed_property() -> None:
-    class Person:
-        age: property = typed_property("age", int)
+class _Person:
+    age: property = typed_property("age", int)
 
-        def __init__(self, age: int) -> None:
-            self._age = age
+    def __init__(self, age: int) -> None:
+        self._age = age
 
-    with pytest.raises(TypeError):
-        Person(age=20).age = None
+
+@pytest.mark.parametrize(
+    "value, expectation",
+    (
+        pytest.param(21, nullcontext(), id="good type"),
+        pytest.param(
+            None, pytest.raises(TypeError, match="must be a"), id="bad type"
+        ),
+    ),
+)
+def test_typed_property(value: Any, expectation: Any) -> None:
+    person: _Person = _Person(age=20)
+    with expectation:
+        person.age = value
+        assert person.age == value
 
 
 def test_abstract_context_manager() -> None: